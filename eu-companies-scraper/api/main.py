@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-import json
+import sys
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Literal
 
+import ijson
+import orjson
 from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
 
 
+# Response schemas. They document /companies and /jobs in OpenAPI only; the
+# endpoints serialize cached dicts directly instead of building model instances.
 class Job(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     title: str
     url: str
 
 
 class Company(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     name: str
     website: str
     career_page_url: str
@@ -23,6 +34,8 @@ class Company(BaseModel):
 
 
 class JobResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     company_name: str
     company_website: str
     country_of_origin: str
@@ -35,94 +48,301 @@ class JobResult(BaseModel):
 BASE_DIR = Path(__file__).resolve().parents[1]
 DATA_FILE = BASE_DIR / "data" / "companies.json"
 SOURCE_HEALTH_FILE = BASE_DIR / "data" / "source_health.json"
+# Above this size companies.json is streamed item by item instead of being
+# decoded into one list first, which bounds peak memory on cache refills.
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 
 app = FastAPI(
     title="Open Job Board EU API",
     version="0.1.0",
     description="Serves scraped EU company data with career pages.",
+    default_response_class=ORJSONResponse,
 )
 
 
+class CompanyIndex:
+    """
+    Validated companies plus lookup tables used by the filters.
+
+    `by_country` / `by_source` map each casefolded value to row numbers, so a
+    partial-match filter only scans the (small) set of distinct values. The
+    trigram tables map 3-grams of the casefolded name / jobs blob to rows and
+    give a candidate superset for substring searches of 3+ characters.
+    `jobs` is the flattened /jobs result set in company order, with each
+    entry pointing back to its company through `_row`.
+    """
+
+    def __init__(self, companies: list[dict[str, Any]]) -> None:
+        self.companies = companies
+        self.by_country: dict[str, list[int]] = {}
+        self.by_source: dict[str, list[int]] = {}
+        self.name_trigrams: dict[str, set[int]] = {}
+        self.jobs_trigrams: dict[str, set[int]] = {}
+        self.jobs: list[dict[str, Any]] = []
+
+        for row, company in enumerate(companies):
+            company["_row"] = row
+            self.jobs.extend(_job_results(company))
+            self.by_country.setdefault(company["_country_cf"], []).append(row)
+            self.by_source.setdefault(company["_source_cf"], []).append(row)
+            for gram in _trigrams(company["_name_cf"]):
+                self.name_trigrams.setdefault(gram, set()).add(row)
+            for gram in _trigrams(company["_jobs_blob_cf"]):
+                self.jobs_trigrams.setdefault(gram, set()).add(row)
+
+
+# Parsed datasets keyed by path; entries are reused while the file's
+# (mtime_ns, size) is unchanged, i.e. until the pipeline rewrites it.
+_COMPANIES_CACHE: dict[Path, tuple[tuple[int, int], CompanyIndex]] = {}
+_SOURCE_HEALTH_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _file_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _load_companies(path: Path = DATA_FILE) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
+    return _load_company_index(path).companies
 
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except json.JSONDecodeError as exc:
-        raise HTTPException(status_code=500, detail=f"Invalid JSON in {path.name}") from exc
 
-    if not isinstance(payload, list):
-        return []
+def _load_company_index(path: Path = DATA_FILE) -> CompanyIndex:
+    file_key = _file_key(path)
+    if file_key is None:
+        return CompanyIndex([])
+
+    cached = _COMPANIES_CACHE.get(path)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+
+    records: Iterable[Any]
+    if file_key[1] > STREAM_THRESHOLD_BYTES:
+        records = _stream_companies(path)
+    else:
+        try:
+            payload = orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError as exc:
+            raise HTTPException(status_code=500, detail=f"Invalid JSON in {path.name}") from exc
+        if not isinstance(payload, list):
+            return CompanyIndex([])
+        records = payload
 
     companies: list[dict[str, Any]] = []
-    for item in payload:
-        if not isinstance(item, dict):
+    for item in records:
+        if not _is_valid_company(item):
             continue
-        if not all(
-            key in item for key in ("name", "website", "career_page_url", "country_of_origin", "source", "jobs")
-        ):
+        item["_public"] = _public_company(item)
+        _add_search_fields(item)
+        companies.append(item)
+
+    companies.sort(key=itemgetter("_name_cf"))
+    index = CompanyIndex(companies)
+    _COMPANIES_CACHE[path] = (file_key, index)
+    return index
+
+
+def _is_valid_company(item: Any) -> bool:
+    """
+    Responses are served without per-request model validation, so records
+    must already match the `Company` schema when they enter the cache.
+    """
+    if not isinstance(item, dict):
+        return False
+    if not all(
+        isinstance(item.get(key), str) for key in ("name", "website", "career_page_url", "country_of_origin", "source")
+    ):
+        return False
+    return bool(item["career_page_url"]) and isinstance(item.get("jobs"), list)
+
+
+def _public_company(company: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": company["name"],
+        "website": company["website"],
+        "career_page_url": company["career_page_url"],
+        "country_of_origin": company["country_of_origin"],
+        "source": company["source"],
+        "jobs": [
+            {"title": job["title"], "url": job["url"]}
+            for job in company["jobs"]
+            if isinstance(job, dict) and isinstance(job.get("title"), str) and isinstance(job.get("url"), str)
+        ],
+    }
+
+
+def _stream_companies(path: Path) -> Iterator[Any]:
+    """
+    Yield the items of the top-level JSON array one at a time. Records that
+    fail validation are dropped before the next one is decoded.
+    """
+    try:
+        with path.open("rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    except ijson.JSONError as exc:
+        raise HTTPException(status_code=500, detail=f"Invalid JSON in {path.name}") from exc
+
+
+def _add_search_fields(company: dict[str, Any]) -> None:
+    """
+    Store casefolded copies of the searchable fields on the record so request
+    handlers only do substring checks. Underscored keys are never served.
+    """
+    # Countries and sources come from a small vocabulary; interning shares one
+    # string object per value across records and the lookup tables.
+    for key in ("country_of_origin", "source"):
+        value = company.get(key)
+        if isinstance(value, str):
+            company[key] = sys.intern(value)
+
+    company["_name_cf"] = str(company.get("name", "")).casefold()
+    company["_country_cf"] = sys.intern(str(company.get("country_of_origin", "")).casefold())
+    company["_source_cf"] = sys.intern(str(company.get("source", "")).casefold())
+    company["_jobs_count"] = len(company.get("jobs", []))
+    company["_jobs_blob_cf"] = "\n".join(
+        f"{job.get('title', '')}\n{job.get('url', '')}".casefold()
+        for job in company.get("jobs") or []
+        if isinstance(job, dict)
+    )
+
+
+def _job_results(company: dict[str, Any]) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for job in company.get("jobs") or []:
+        if not isinstance(job, dict):
             continue
-        if not item.get("career_page_url"):
+        title = str(job.get("title", "")).strip()
+        url = str(job.get("url", "")).strip()
+        if not title or not url:
             continue
-        companies.append(item)
+        results.append(
+            {
+                "_public": {
+                    "company_name": company["name"],
+                    "company_website": company["website"],
+                    "country_of_origin": company["country_of_origin"],
+                    "source": company["source"],
+                    "career_page_url": company["career_page_url"],
+                    "title": title,
+                    "url": url,
+                },
+                "_row": company["_row"],
+                "_company_cf": company["_name_cf"],
+                "_country_cf": company["_country_cf"],
+                "_source_cf": company["_source_cf"],
+                "_title_cf": title.casefold(),
+                "_url_cf": url.casefold(),
+            }
+        )
+    return results
 
-    companies.sort(key=lambda company: str(company.get("name", "")).lower())
-    return companies
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 def _load_source_health(path: Path = SOURCE_HEALTH_FILE) -> dict[str, Any]:
-    if not path.exists():
+    file_key = _file_key(path)
+    if file_key is None:
         return {"message": "No source health data found yet."}
+
+    cached = _SOURCE_HEALTH_CACHE.get(path)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+
     try:
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in {path.name}") from exc
     if not isinstance(payload, dict):
         return {"message": "Invalid source health format."}
+
+    _SOURCE_HEALTH_CACHE[path] = (file_key, payload)
     return payload
 
 
-def _contains_casefold(haystack: str, needle: str) -> bool:
-    return needle.casefold() in haystack.casefold()
+def _rows_by_value(table: dict[str, list[int]], needle: str) -> set[int]:
+    return {row for value, rows in table.items() if needle in value for row in rows}
+
+
+def _rows_by_trigrams(table: dict[str, set[int]], needle: str) -> set[int] | None:
+    grams = _trigrams(needle)
+    if not grams:
+        return None
+    postings = sorted((table.get(gram, set()) for gram in grams), key=len)
+    return postings[0].intersection(*postings[1:])
 
 
 def _apply_company_filters(
-    companies: list[dict[str, Any]],
+    index: CompanyIndex,
     country: str | None,
     source: str | None,
     company: str | None,
     jobs_query: str | None,
     has_jobs: bool | None,
 ) -> list[dict[str, Any]]:
-    filtered = companies
-
-    if country:
-        filtered = [c for c in filtered if _contains_casefold(str(c.get("country_of_origin", "")), country)]
-    if source:
-        filtered = [c for c in filtered if _contains_casefold(str(c.get("source", "")), source)]
-    if company:
-        filtered = [c for c in filtered if _contains_casefold(str(c.get("name", "")), company)]
-    if has_jobs is True:
-        filtered = [c for c in filtered if c.get("jobs")]
-    if has_jobs is False:
-        filtered = [c for c in filtered if not c.get("jobs")]
-
-    if jobs_query:
-        jq = jobs_query.casefold()
-        filtered = [
-            c
-            for c in filtered
-            if any(
-                jq in str(job.get("title", "")).casefold() or jq in str(job.get("url", "")).casefold()
-                for job in c.get("jobs", [])
-                if isinstance(job, dict)
-            )
-        ]
-
-    return filtered
+    country_cf = country.casefold() if country else ""
+    source_cf = source.casefold() if source else ""
+    company_cf = company.casefold() if company else ""
+    jobs_query_cf = jobs_query.casefold() if jobs_query else ""
+
+    # Narrow down to candidate rows via the index tables. Country/source rows
+    # are exact; trigram rows are a superset confirmed by substring checks below.
+    candidate_sets: list[set[int]] = []
+    if country_cf:
+        candidate_sets.append(_rows_by_value(index.by_country, country_cf))
+    if source_cf:
+        candidate_sets.append(_rows_by_value(index.by_source, source_cf))
+    if company_cf:
+        trigram_rows = _rows_by_trigrams(index.name_trigrams, company_cf)
+        if trigram_rows is not None:
+            candidate_sets.append(trigram_rows)
+    if jobs_query_cf:
+        trigram_rows = _rows_by_trigrams(index.jobs_trigrams, jobs_query_cf)
+        if trigram_rows is not None:
+            candidate_sets.append(trigram_rows)
+
+    if candidate_sets:
+        candidate_sets.sort(key=len)
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+        rows = [index.companies[row] for row in sorted(candidates)]
+    else:
+        rows = index.companies
+
+    if has_jobs is None and not company_cf and not jobs_query_cf:
+        return rows
+
+    # One pass over the candidates, cheapest checks first.
+    return [
+        c
+        for c in rows
+        if (has_jobs is None or bool(c.get("jobs")) is has_jobs)
+        and (not company_cf or company_cf in c["_name_cf"])
+        and (not jobs_query_cf or jobs_query_cf in c["_jobs_blob_cf"])
+    ]
+
+
+_COMPANY_SORT_KEYS = {
+    "company": itemgetter("_name_cf"),
+    "country": itemgetter("_country_cf"),
+    "source": itemgetter("_source_cf"),
+    "jobs_count": itemgetter("_jobs_count"),
+}
+
+_JOB_SORT_KEYS = {
+    "company": itemgetter("_company_cf"),
+    "country": itemgetter("_country_cf"),
+    "source": itemgetter("_source_cf"),
+    "title": itemgetter("_title_cf"),
+}
 
 
 def _sort_companies(
@@ -130,18 +350,10 @@ def _sort_companies(
     sort_by: Literal["company", "country", "source", "jobs_count"],
     sort_order: Literal["asc", "desc"],
 ) -> list[dict[str, Any]]:
-    reverse = sort_order == "desc"
-
-    if sort_by == "company":
-        key_fn = lambda c: str(c.get("name", "")).casefold()
-    elif sort_by == "country":
-        key_fn = lambda c: str(c.get("country_of_origin", "")).casefold()
-    elif sort_by == "source":
-        key_fn = lambda c: str(c.get("source", "")).casefold()
-    else:
-        key_fn = lambda c: len(c.get("jobs", []))
-
-    return sorted(companies, key=key_fn, reverse=reverse)
+    if sort_by == "company" and sort_order == "asc":
+        # Filtering keeps the cached order, which is already sorted by name.
+        return list(companies)
+    return sorted(companies, key=_COMPANY_SORT_KEYS[sort_by], reverse=sort_order == "desc")
 
 
 @app.get("/", tags=["meta"])
@@ -149,7 +361,7 @@ def root() -> dict[str, str]:
     return {"message": "Open Job Board EU API is running."}
 
 
-@app.get("/companies", response_model=list[Company], tags=["companies"])
+@app.get("/companies", responses={200: {"model": list[Company]}}, tags=["companies"])
 def get_companies(
     country: str | None = Query(default=None, description="Filter by country (partial match)."),
     source: str | None = Query(default=None, description="Filter by source (partial match)."),
@@ -158,14 +370,14 @@ def get_companies(
     has_jobs: bool | None = Query(default=None, description="If true, only companies with jobs."),
     sort_by: Literal["company", "country", "source", "jobs_count"] = Query(default="company"),
     sort_order: Literal["asc", "desc"] = Query(default="asc"),
-) -> list[dict[str, Any]]:
-    companies = _load_companies()
-    companies = _apply_company_filters(companies, country, source, company, jobs_query, has_jobs)
+) -> ORJSONResponse:
+    companies = _apply_company_filters(_load_company_index(), country, source, company, jobs_query, has_jobs)
     companies = _sort_companies(companies, sort_by, sort_order)
-    return companies
+    # Records are validated when cached; serialize their public views as-is.
+    return ORJSONResponse([c["_public"] for c in companies])
 
 
-@app.get("/jobs", response_model=list[JobResult], tags=["jobs"])
+@app.get("/jobs", responses={200: {"model": list[JobResult]}}, tags=["jobs"])
 def search_jobs(
     query: str | None = Query(default=None, description="Search term in job title or URL."),
     country: str | None = Query(default=None, description="Filter by company country."),
@@ -173,45 +385,24 @@ def search_jobs(
     company: str | None = Query(default=None, description="Filter by company name."),
     sort_by: Literal["company", "country", "source", "title"] = Query(default="company"),
     sort_order: Literal["asc", "desc"] = Query(default="asc"),
-) -> list[dict[str, Any]]:
-    companies = _load_companies()
-    companies = _apply_company_filters(companies, country, source, company, None, True)
-
-    results: list[dict[str, Any]] = []
-    for c in companies:
-        for job in c.get("jobs", []):
-            if not isinstance(job, dict):
-                continue
-            title = str(job.get("title", "")).strip()
-            url = str(job.get("url", "")).strip()
-            if not title or not url:
-                continue
-            if query and not (
-                _contains_casefold(title, query) or _contains_casefold(url, query)
-            ):
-                continue
-            results.append(
-                {
-                    "company_name": c.get("name", ""),
-                    "company_website": c.get("website", ""),
-                    "country_of_origin": c.get("country_of_origin", ""),
-                    "source": c.get("source", ""),
-                    "career_page_url": c.get("career_page_url", ""),
-                    "title": title,
-                    "url": url,
-                }
-            )
-
-    reverse = sort_order == "desc"
-    if sort_by == "title":
-        key_fn = lambda r: str(r.get("title", "")).casefold()
-    elif sort_by == "country":
-        key_fn = lambda r: str(r.get("country_of_origin", "")).casefold()
-    elif sort_by == "source":
-        key_fn = lambda r: str(r.get("source", "")).casefold()
-    else:
-        key_fn = lambda r: str(r.get("company_name", "")).casefold()
-    return sorted(results, key=key_fn, reverse=reverse)
+) -> ORJSONResponse:
+    index = _load_company_index()
+    rows: set[int] | None = None
+    if country or source or company:
+        rows = {c["_row"] for c in _apply_company_filters(index, country, source, company, None, True)}
+    needle = query.casefold() if query else ""
+
+    results = [
+        job
+        for job in index.jobs
+        if (rows is None or job["_row"] in rows)
+        and (not needle or needle in job["_title_cf"] or needle in job["_url_cf"])
+    ]
+
+    if sort_by != "company" or sort_order != "asc":
+        # Otherwise the jobs index is already in cached company order.
+        results.sort(key=_JOB_SORT_KEYS[sort_by], reverse=sort_order == "desc")
+    return ORJSONResponse([job["_public"] for job in results])
 
 
 @app.get("/sources/health", tags=["meta"])
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
+from collections.abc import Coroutine, Iterator
+from functools import lru_cache
 from typing import Any
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urljoin, urlparse
 
+import orjson
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
@@ -15,6 +17,15 @@ from scrapers.base_scraper import BaseScraper
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parsed(url: str) -> ParseResult:
+    """
+    `urlparse` memoized per URL string; the same homepage, candidate and job
+    URLs are parsed repeatedly while one company is enriched.
+    """
+    return urlparse(url)
+
+
 class CareerFinder(BaseScraper):
     """
     Enriches company records with a careers page URL.
@@ -40,6 +51,27 @@ class CareerFinder(BaseScraper):
         "workday",
         "talent",
     )
+    _CAREER_RE = re.compile("|".join(map(re.escape, CAREER_KEYWORDS)))
+
+    JOB_LINK_BLOCKED_TOKENS = ("privacy", "cookie", "terms", "linkedin.com/company", "facebook.com")
+    JOB_LINK_TOKENS = (
+        "job",
+        "jobs",
+        "position",
+        "opening",
+        "vacanc",
+        "careers",
+        "apply",
+        "workday",
+        "greenhouse",
+        "lever",
+    )
+    _JOB_LINK_BLOCKED_RE = re.compile("|".join(map(re.escape, JOB_LINK_BLOCKED_TOKENS)))
+    _JOB_LINK_RE = re.compile("|".join(map(re.escape, JOB_LINK_TOKENS)))
+
+    CAREER_PAGE_SNIPPET_CHARS = 8000
+    # Whitespace-tolerant, so the page text does not need collapsing first.
+    _CAREER_PAGE_PHRASES_RE = re.compile(r"open\s+positions|job\s+openings|vacancies|apply\s+now")
 
     COMMON_CAREER_PATHS = (
         "/careers",
@@ -64,9 +96,20 @@ class CareerFinder(BaseScraper):
         "bamboohr.com",
     )
 
+    # Upper bound on memoized page downloads kept alive during one run.
+    MAX_CACHED_PAGES = 256
+
+    # Most candidate URLs are speculative probes of small company sites; one retry
+    # covers a blip without multiplying the wait on hosts that are simply down.
+    MAX_RETRIES = 1
+
     def __init__(self, max_concurrency: int = 8) -> None:
         super().__init__(source_name=self.SOURCE_NAME, rate_limit_seconds=1.0, timeout_seconds=12.0)
         self.max_concurrency = max_concurrency
+        self._fetch_cache: dict[str, asyncio.Task[str | None]] = {}
+        self._career_page_cache: dict[str, asyncio.Task[bool]] = {}
+        # Every memoized task still running, including ones already evicted from a memo.
+        self._pending_tasks: set[asyncio.Task[Any]] = set()
 
     async def scrape(self) -> list[dict[str, Any]]:
         """
@@ -82,9 +125,53 @@ class CareerFinder(BaseScraper):
         """
         semaphore = asyncio.Semaphore(self.max_concurrency)
         tasks = [self._enrich_one(company, semaphore) for company in companies]
-        results = await asyncio.gather(*tasks)
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # If the gather failed or was cancelled, stop downloads nobody will read.
+            for task in self._pending_tasks:
+                task.cancel()
+            self._pending_tasks.clear()
+            self._fetch_cache.clear()
+            self._career_page_cache.clear()
         return [item for item in results if item is not None]
 
+    async def fetch(self, url: str) -> str | None:
+        """
+        Memoized `BaseScraper.fetch`: repeated or concurrent requests for the
+        same URL during a run share one download. The memo is size-bounded and
+        evicts the least recently used page first.
+        """
+        key = self.normalize_url(url)
+        task = self._fetch_cache.pop(key, None)
+        if task is None:
+            task = self._memoized_task(self._fetch_cache, key, super().fetch(url))
+            if len(self._fetch_cache) >= self.MAX_CACHED_PAGES:
+                self._fetch_cache.pop(next(iter(self._fetch_cache)))
+        self._fetch_cache[key] = task
+        # shield: a cancelled caller must not cancel the download other callers share.
+        return await asyncio.shield(task)
+
+    def _memoized_task(
+        self, cache: dict[str, asyncio.Task[Any]], key: str, coro: Coroutine[Any, Any, Any]
+    ) -> asyncio.Task[Any]:
+        """
+        Start a task whose result is shared through cache. A task that ends in
+        cancellation or an exception is dropped, so the next caller retries.
+        """
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+
+        def _done(finished: asyncio.Task[Any]) -> None:
+            self._pending_tasks.discard(finished)
+            # exception() also marks a failure as retrieved when no caller is left to see it.
+            if finished.cancelled() or finished.exception() is not None:
+                if cache.get(key) is finished:
+                    del cache[key]
+
+        task.add_done_callback(_done)
+        return task
+
     async def _enrich_one(
         self, company: dict[str, Any], semaphore: asyncio.Semaphore
     ) -> dict[str, Any] | None:
@@ -107,7 +194,7 @@ class CareerFinder(BaseScraper):
 
     async def find_career_page(self, website_url: str) -> str | None:
         website_url = self._ensure_http_scheme(self.normalize_url(website_url))
-        parsed_home = urlparse(website_url)
+        parsed_home = _parsed(website_url)
         home_domain = parsed_home.netloc.lower()
 
         # 1) Discover career links from homepage.
@@ -133,7 +220,7 @@ class CareerFinder(BaseScraper):
         return None
 
     def _extract_career_links(self, html: str, base_url: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         found: list[str] = []
         seen: set[str] = set()
 
@@ -142,20 +229,21 @@ class CareerFinder(BaseScraper):
             if not href:
                 continue
 
-            link_text = " ".join(
-                filter(
-                    None,
-                    [
-                        link.get_text(" ", strip=True),
-                        (link.get("title") or "").strip(),
-                        (link.get("aria-label") or "").strip(),
-                        href,
-                    ],
-                )
-            ).lower()
-
-            if not self._contains_career_keyword(link_text):
-                continue
+            # Most career links say so in the URL; only walk the link subtree
+            # for its text when the href alone does not match.
+            if not self._contains_career_keyword(href.lower()):
+                link_text = " ".join(
+                    filter(
+                        None,
+                        [
+                            link.get_text(" ", strip=True),
+                            (link.get("title") or "").strip(),
+                            (link.get("aria-label") or "").strip(),
+                        ],
+                    )
+                ).lower()
+                if not self._contains_career_keyword(link_text):
+                    continue
 
             absolute = self.normalize_url(urljoin(base_url, href))
             if absolute in seen:
@@ -166,31 +254,36 @@ class CareerFinder(BaseScraper):
         return found
 
     async def _is_valid_career_page(self, url: str) -> bool:
+        key = self.normalize_url(url)
+        task = self._career_page_cache.get(key)
+        if task is None:
+            task = self._memoized_task(self._career_page_cache, key, self._check_career_page(url))
+            self._career_page_cache[key] = task
+        return await asyncio.shield(task)
+
+    async def _check_career_page(self, url: str) -> bool:
         html = await self.fetch(url)
         if not html:
             return False
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         title = (soup.title.string or "").strip().lower() if soup.title and soup.title.string else ""
 
-        body_text = soup.get_text(" ", strip=True).lower()
-        body_text = re.sub(r"\s+", " ", body_text)
-        snippet = body_text[:5000]
-
         if self._contains_career_keyword(title):
             return True
         if self._contains_career_keyword(url.lower()):
             return True
-        if any(word in snippet for word in ("open positions", "job openings", "vacancies", "apply now")):
-            return True
-        return False
+
+        # Only the start of the page is inspected, so slice before lowercasing.
+        snippet = soup.get_text(" ", strip=True)[: self.CAREER_PAGE_SNIPPET_CHARS].lower()
+        return self._CAREER_PAGE_PHRASES_RE.search(snippet) is not None
 
     async def extract_jobs(self, career_url: str, company_website: str) -> list[dict[str, str]]:
         html = await self.fetch(career_url)
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         jobs: list[dict[str, str]] = []
         seen: set[str] = set()
 
@@ -203,14 +296,14 @@ class CareerFinder(BaseScraper):
             if len(jobs) >= self.MAX_JOBS_PER_COMPANY:
                 return jobs
 
-        company_domain = urlparse(self._ensure_http_scheme(company_website)).netloc.lower()
+        company_domain = _parsed(self._ensure_http_scheme(company_website)).netloc.lower()
         for link in soup.select("a[href]"):
             href = (link.get("href") or "").strip()
             if not href:
                 continue
 
             absolute = self.normalize_url(urljoin(career_url, href))
-            title = re.sub(r"\s+", " ", link.get_text(" ", strip=True)).strip()
+            title = " ".join(link.get_text(" ", strip=True).split())
             if not title or not self._looks_like_job_link(title, absolute):
                 continue
             if not self._is_job_domain_allowed(company_domain, absolute):
@@ -226,43 +319,47 @@ class CareerFinder(BaseScraper):
 
         return jobs
 
-    def _extract_jobs_from_json_ld(self, soup: BeautifulSoup) -> list[dict[str, str]]:
-        jobs: list[dict[str, str]] = []
+    def _extract_jobs_from_json_ld(self, soup: BeautifulSoup) -> Iterator[dict[str, str]]:
+        """
+        Yield JobPosting entries lazily; extract_jobs dedupes them and stops
+        once it has MAX_JOBS_PER_COMPANY unique jobs.
+        """
         for script in soup.select("script[type='application/ld+json']"):
             raw = script.string or script.get_text(strip=True)
             if not raw:
                 continue
             try:
-                payload = json.loads(raw)
-            except Exception:
+                # orjson only accepts exact str/bytes, not bs4's NavigableString.
+                payload = orjson.loads(str(raw))
+            except orjson.JSONDecodeError:
                 continue
-            jobs.extend(self._walk_job_postings(payload))
-        return jobs
-
-    def _walk_job_postings(self, obj: Any) -> list[dict[str, str]]:
-        results: list[dict[str, str]] = []
-        if isinstance(obj, list):
-            for item in obj:
-                results.extend(self._walk_job_postings(item))
-            return results
+            yield from self._walk_job_postings(payload)
 
-        if not isinstance(obj, dict):
-            return results
+    def _walk_job_postings(self, obj: Any) -> Iterator[dict[str, str]]:
+        """
+        Yield JobPosting entries in document order.
+        """
+        stack: list[Any] = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
 
-        obj_type = obj.get("@type")
-        if obj_type == "JobPosting" or (isinstance(obj_type, list) and "JobPosting" in obj_type):
-            title = str(obj.get("title", "")).strip()
-            url = str(obj.get("url", "")).strip()
-            if title and url:
-                results.append({"title": title, "url": self.normalize_url(url)})
+            obj_type = node.get("@type")
+            if obj_type == "JobPosting" or (isinstance(obj_type, list) and "JobPosting" in obj_type):
+                title = str(node.get("title", "")).strip()
+                url = str(node.get("url", "")).strip()
+                if title and url:
+                    yield {"title": title, "url": self.normalize_url(url)}
 
-        for value in obj.values():
-            results.extend(self._walk_job_postings(value))
-        return results
+            stack.extend(reversed(list(node.values())))
 
     @classmethod
     def _contains_career_keyword(cls, text: str) -> bool:
-        return any(keyword in text for keyword in cls.CAREER_KEYWORDS)
+        return cls._CAREER_RE.search(text) is not None
 
     @staticmethod
     def _ensure_http_scheme(url: str) -> str:
@@ -272,7 +369,7 @@ class CareerFinder(BaseScraper):
 
     @staticmethod
     def _is_related_domain(home_domain: str, url: str) -> bool:
-        candidate_domain = urlparse(url).netloc.lower()
+        candidate_domain = _parsed(url).netloc.lower()
         if not candidate_domain:
             return False
         if candidate_domain == home_domain:
@@ -282,32 +379,17 @@ class CareerFinder(BaseScraper):
     @staticmethod
     def _is_valid_website(url: str) -> bool:
         candidate = url if url.startswith(("http://", "https://")) else f"https://{url}"
-        parsed = urlparse(candidate)
+        parsed = _parsed(candidate)
         return bool(parsed.netloc and "." in parsed.netloc and len(candidate) <= 220)
 
     def _looks_like_job_link(self, title: str, url: str) -> bool:
         blob = f"{title} {url}".lower()
-        blocked_tokens = ("privacy", "cookie", "terms", "linkedin.com/company", "facebook.com")
-        if any(token in blob for token in blocked_tokens):
+        if self._JOB_LINK_BLOCKED_RE.search(blob):
             return False
-        return any(
-            token in blob
-            for token in (
-                "job",
-                "jobs",
-                "position",
-                "opening",
-                "vacanc",
-                "careers",
-                "apply",
-                "workday",
-                "greenhouse",
-                "lever",
-            )
-        )
+        return self._JOB_LINK_RE.search(blob) is not None
 
     def _is_job_domain_allowed(self, company_domain: str, url: str) -> bool:
-        domain = urlparse(url).netloc.lower()
+        domain = _parsed(url).netloc.lower()
         if not domain:
             return False
         if domain == company_domain or domain.endswith("." + company_domain):
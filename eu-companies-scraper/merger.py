@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
-import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
+
+import orjson
 
 
 FINAL_KEYS = (
@@ -26,6 +28,8 @@ def merge_company_lists(*company_lists: list[dict[str, Any]]) -> list[dict[str,
     2) normalized company name
     """
     merged: list[dict[str, Any]] = []
+    # id(record) -> index in `merged`, so upgrades replace records in O(1).
+    position: dict[int, int] = {}
     by_domain: dict[str, dict[str, Any]] = {}
     by_name: dict[str, dict[str, Any]] = {}
 
@@ -45,6 +49,7 @@ def merge_company_lists(*company_lists: list[dict[str, Any]]) -> list[dict[str,
                 existing = by_name[name_key]
 
             if existing is None:
+                position[id(company)] = len(merged)
                 merged.append(company)
                 by_name[name_key] = company
                 if domain_key:
@@ -53,7 +58,10 @@ def merge_company_lists(*company_lists: list[dict[str, Any]]) -> list[dict[str,
 
             resolved = _prefer_more_complete(existing, company)
             if resolved is not existing:
-                _replace_in_list(merged, existing, resolved)
+                idx = position.pop(id(existing), None)
+                if idx is not None:
+                    merged[idx] = resolved
+                    position[id(resolved)] = idx
                 by_name[name_key] = resolved
                 if domain_key:
                     by_domain[domain_key] = resolved
@@ -66,8 +74,7 @@ def load_companies_json(path: str | Path) -> list[dict[str, Any]]:
     file_path = Path(path)
     if not file_path.exists():
         return []
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(file_path.read_bytes())
     if not isinstance(data, list):
         return []
     return [item for item in data if isinstance(item, dict)]
@@ -76,17 +83,25 @@ def load_companies_json(path: str | Path) -> list[dict[str, Any]]:
 def save_companies_json(path: str | Path, companies: list[dict[str, Any]]) -> None:
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("w", encoding="utf-8") as f:
-        json.dump(companies, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    file_path.write_bytes(orjson.dumps(companies, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+
+
+def _text(record: dict[str, Any], key: str) -> str:
+    """
+    Stripped string value of `record[key]`; only non-str values pay for `str()`.
+    """
+    value = record.get(key, "")
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
 
 
 def _to_final_record(raw: dict[str, Any]) -> dict[str, Any] | None:
-    name = str(raw.get("name", "")).strip()
-    website = _normalize_url(str(raw.get("website", "")).strip())
-    career_page_url = _normalize_url(str(raw.get("career_page_url", "")).strip())
-    country = str(raw.get("country_of_origin", "")).strip()
-    source = str(raw.get("source", "")).strip()
+    name = _text(raw, "name")
+    website = _normalize_url(_text(raw, "website"))
+    career_page_url = _normalize_url(_text(raw, "career_page_url"))
+    country = _text(raw, "country_of_origin")
+    source = _text(raw, "source")
     jobs = _normalize_jobs(raw.get("jobs", []))
 
     # Final output requirement: skip companies without career pages.
@@ -97,6 +112,8 @@ def _to_final_record(raw: dict[str, Any]) -> dict[str, Any] | None:
         country = "Unknown"
     if not source:
         source = "unknown"
+    country = sys.intern(country)
+    source = sys.intern(source)
 
     return {
         "name": name,
@@ -144,22 +161,18 @@ def _record_score(record: dict[str, Any]) -> int:
     return score
 
 
-def _replace_in_list(items: list[dict[str, Any]], old: dict[str, Any], new: dict[str, Any]) -> None:
-    for i, item in enumerate(items):
-        if item is old:
-            items[i] = new
-            return
+def _normalize_name(name: str) -> str:
+    return " ".join(name.lower().split())
 
 
-def _normalize_name(name: str) -> str:
-    name = name.lower().strip()
-    name = re.sub(r"\s+", " ", name)
-    return name
+@lru_cache(maxsize=4096)
+def _parsed(url: str) -> ParseResult:
+    return urlparse(url)
 
 
 def _domain_key(url: str) -> str:
     try:
-        netloc = urlparse(url).netloc.lower()
+        netloc = _parsed(url).netloc.lower()
     except Exception:
         return ""
     if netloc.startswith("www."):
@@ -168,18 +181,19 @@ def _domain_key(url: str) -> str:
 
 
 def _normalize_url(url: str) -> str:
-    url = url.strip()
+    # Callers pass values already stripped by `_text`.
     if not url:
         return ""
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
-    parsed = urlparse(url)
-    if not parsed.netloc or "." not in parsed.netloc:
-        return ""
     if len(url) > 220:
         return ""
     if url.endswith("/"):
         url = url[:-1]
+    # Parse the final form so `_domain_key` on the stored URL is a cache hit.
+    parsed = _parsed(url)
+    if not parsed.netloc or "." not in parsed.netloc:
+        return ""
     return url
 
 
@@ -191,8 +205,8 @@ def _normalize_jobs(raw_jobs: Any) -> list[dict[str, str]]:
     for item in raw_jobs:
         if not isinstance(item, dict):
             continue
-        title = str(item.get("title", "")).strip()
-        url = _normalize_url(str(item.get("url", "")).strip())
+        title = _text(item, "title")
+        url = _normalize_url(_text(item, "url"))
         if not title or not url:
             continue
         key = f"{title.lower()}|{url.lower()}"
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from career_finder import CareerFinder
 from merger import merge_company_lists, save_companies_json
+from scrapers.base_scraper import BaseScraper, DomainState
 from scrapers.clutch_scraper import ClutchScraper
 from scrapers.eu_startups_scraper import EUStartupsScraper
 from scrapers.manifest_scraper import ManifestScraper
@@ -29,41 +31,44 @@ def _source_counts(companies: list[dict[str, Any]]) -> dict[str, int]:
 
 
 def _dedupe_candidates(companies: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    deduped: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
+    # First record per (name, website) wins; dicts keep insertion order.
+    deduped: dict[tuple[str, str], dict[str, Any]] = {}
     for company in companies:
         name = str(company.get("name", "")).strip().lower()
         website = str(company.get("website", "")).strip().lower()
-        key = (name, website)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(company)
-    return deduped
+        deduped.setdefault((name, website), company)
+    return list(deduped.values())
 
 
 def _save_source_health(payload: dict[str, Any]) -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with SOURCE_HEALTH_PATH.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-
+    SOURCE_HEALTH_PATH.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
-async def run_pipeline() -> dict[str, Any]:
-    async with WikipediaScraper() as wikipedia:
-        wikipedia_candidates = await wikipedia.scrape()
 
-    async with WikipediaGlobalScraper() as wikipedia_global:
-        wikipedia_global_candidates = await wikipedia_global.scrape()
+async def _run_scraper(scraper_cls: type[BaseScraper], **kwargs: Any) -> list[dict[str, Any]]:
+    async with scraper_cls(**kwargs) as scraper:
+        return await scraper.scrape()
 
-    async with EUStartupsScraper() as eu_startups:
-        eu_startups_candidates = await eu_startups.scrape()
 
-    async with ClutchScraper() as clutch:
-        clutch_candidates = await clutch.scrape()
-
-    async with ManifestScraper() as manifest:
-        manifest_candidates = await manifest.scrape()
+async def run_pipeline() -> dict[str, Any]:
+    # Sources are independent, so their network waits can overlap. Both Wikipedia
+    # scrapers talk to en.wikipedia.org and share one client's connection pool, plus
+    # one rate-limit budget and robots.txt cache for it.
+    wikipedia_state = DomainState()
+    async with BaseScraper.build_client() as wikipedia_client:
+        (
+            wikipedia_candidates,
+            wikipedia_global_candidates,
+            eu_startups_candidates,
+            clutch_candidates,
+            manifest_candidates,
+        ) = await asyncio.gather(
+            _run_scraper(WikipediaScraper, client=wikipedia_client, domain_state=wikipedia_state),
+            _run_scraper(WikipediaGlobalScraper, client=wikipedia_client, domain_state=wikipedia_state),
+            _run_scraper(EUStartupsScraper),
+            _run_scraper(ClutchScraper),
+            _run_scraper(ManifestScraper),
+        )
 
     all_candidates = (
         wikipedia_candidates
@@ -101,7 +106,7 @@ async def run_pipeline() -> dict[str, Any]:
 
 def main() -> None:
     health = asyncio.run(run_pipeline())
-    print(json.dumps(health, indent=2))
+    print(orjson.dumps(health, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, DomainState
 from .clutch_scraper import ClutchScraper
 from .eu_startups_scraper import EUStartupsScraper
 from .manifest_scraper import ManifestScraper
@@ -7,6 +7,7 @@ from .wikipedia_scraper import WikipediaScraper
 
 __all__ = [
     "BaseScraper",
+    "DomainState",
     "WikipediaScraper",
     "ClutchScraper",
     "ManifestScraper",
@@ -2,19 +2,71 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
+import random
+import re
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
+import orjson
+from cachetools import TLRUCache
+from lxml import etree
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_USER_AGENT = (
+    "OpenJobBoardEU/1.0 (https://github.com/Artenis/Open-Job-Board-EU; contact: openjobboardeu@example.com)"
+)
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+# Same strings BeautifulSoup's get_text() yields: no script/style bodies, no comments.
+_TEXT_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]", smart_strings=False)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_url(url: str) -> str:
+    # Scrapers normalize the same links over and over (JSON-LD and anchors, list pages,
+    # the fetch() key), so the urlparse/urlunparse round trip is memoized per string.
+    parsed = urlparse(url.strip())
+    cleaned = parsed._replace(fragment="")
+    normalized = urlunparse(cleaned)
+    if normalized.endswith("/"):
+        normalized = normalized[:-1]
+    return normalized
+
+
+def _html_cache_expiry(_url: str, entry: tuple[float, str], now: float) -> float:
+    return now + entry[0]
+
+
+def _html_cache_entry_size(entry: tuple[float, str]) -> int:
+    return len(entry[1])
+
+
+class DomainState:
+    """
+    Per-domain robots.txt rules and rate-limit buckets.
+    Scrapers that share a client for one host should share one of these as well,
+    so the host sees a single request budget and robots.txt is read once.
+    """
+
+    def __init__(self) -> None:
+        self.robots_cache: dict[str, tuple[RobotFileParser, float]] = {}
+        self.robots_locks: dict[str, asyncio.Lock] = {}
+        self.domain_locks: dict[str, asyncio.Lock] = {}
+        self.buckets: dict[str, tuple[float, float]] = {}
+
 
 class BaseScraper(ABC):
     """
@@ -26,32 +78,64 @@ class BaseScraper(ABC):
     - common URL/data utilities
     """
 
+    # robots.txt rules (including "allow all" after a failed fetch) are re-read after this long.
+    ROBOTS_TTL_SECONDS = float(os.getenv("SCRAPER_ROBOTS_TTL_SECONDS", "21600"))
+    # Parsing limit for robots.txt (RFC 9309 asks for at least 500 KiB); rules past it are ignored.
+    MAX_ROBOTS_BYTES = 512 * 1024
+
+    # Bodies larger than this are dropped before they reach a parser.
+    MAX_HTML_BYTES = 4 * 1024 * 1024
+
+    # Timeouts, connection errors, 408, 429 and 5xx are retried with jittered exponential
+    # backoff; other 4xx answers will not change and fail immediately.
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 0.5
+    MAX_RETRY_AFTER_SECONDS = 60.0
+
+    # Successful page bodies keyed by normalized URL, shared by every scraper in the process.
+    # Entries are (ttl_seconds, text) so each one can expire on its own Cache-Control max-age.
+    # The cap counts characters of cached text, not entries: one body can be MAX_HTML_BYTES.
+    HTML_CACHE_MAX_CHARS = int(os.getenv("SCRAPER_HTML_CACHE_MAX_CHARS", str(64 * 1024 * 1024)))
+    _HTML_CACHE: TLRUCache = TLRUCache(
+        maxsize=HTML_CACHE_MAX_CHARS,
+        ttu=_html_cache_expiry,
+        timer=time.monotonic,
+        getsizeof=_html_cache_entry_size,
+    )
+
+    # Optional on-disk copy of the same entries so reruns (development, CI) skip the network.
+    # Off unless SCRAPER_CACHE_DIR is set, e.g. to .cache/http. Stale files are revalidated
+    # with If-None-Match / If-Modified-Since and reused on 304 Not Modified.
+    DISK_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", "")
+
     def __init__(
         self,
         source_name: str,
         user_agent: str | None = None,
         rate_limit_seconds: float = 1.0,
         timeout_seconds: float = 20.0,
+        cache_ttl: float = 86400.0,
+        client: httpx.AsyncClient | None = None,
+        domain_state: DomainState | None = None,
     ) -> None:
-        self.source_name = source_name
-        self.user_agent = user_agent or os.getenv(
-            "SCRAPER_USER_AGENT",
-            "OpenJobBoardEU/1.0 (https://github.com/Artenis/Open-Job-Board-EU; contact: openjobboardeu@example.com)",
-        )
+        self.source_name = sys.intern(source_name)
+        self.user_agent = user_agent or os.getenv("SCRAPER_USER_AGENT", DEFAULT_USER_AGENT)
         self.rate_limit_seconds = rate_limit_seconds
+        self.cache_ttl = cache_ttl
+        # Idle domains can absorb a short burst; the long-run rate stays 1 / rate_limit_seconds.
+        self.rate_limit_burst = max(4, int(2 / rate_limit_seconds)) if rate_limit_seconds > 0 else 1
 
-        self._client = httpx.AsyncClient(
-            timeout=timeout_seconds,
-            follow_redirects=True,
-            headers={
-                "User-Agent": self.user_agent,
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
+        # A client passed in is shared with other scrapers and stays open after close().
+        self._owns_client = client is None
+        self._client = client or self.build_client(self.user_agent, timeout_seconds)
 
-        self._robots_cache: dict[str, RobotFileParser] = {}
-        self._domain_locks: dict[str, asyncio.Lock] = {}
-        self._last_request_ts: dict[str, float] = {}
+        # Like the client, domain state passed in is shared with the other scrapers using it;
+        # each scraper still refills the shared buckets at its own rate.
+        state = domain_state or DomainState()
+        self._robots_cache = state.robots_cache
+        self._robots_locks = state.robots_locks
+        self._domain_locks = state.domain_locks
+        self._buckets = state.buckets
 
     async def __aenter__(self) -> "BaseScraper":
         return self
@@ -60,7 +144,35 @@ class BaseScraper(ABC):
         await self.close()
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
+
+    @staticmethod
+    def build_client(user_agent: str | None = None, timeout_seconds: float = 20.0) -> httpx.AsyncClient:
+        """
+        HTTP/2 keep-alive client with the scraper request headers.
+        Scrapers that hit the same host can share one to reuse its connections.
+        """
+        return httpx.AsyncClient(
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            http2=True,
+            # Idle connections stay pooled for a minute, enough to bridge a list page and the
+            # detail pages fetched after it is parsed without a new TLS handshake.
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=60.0,
+            ),
+            # Connection: keep-alive is left to httpx, which sends it on HTTP/1.1 and lets h2
+            # strip it on HTTP/2 connections. Compressed bodies arrive already decoded.
+            headers={
+                "User-Agent": user_agent or os.getenv("SCRAPER_USER_AGENT", DEFAULT_USER_AGENT),
+                "Accept-Language": "en-US,en;q=0.9",
+                # br is only safe to advertise because the brotli extra is a declared dependency.
+                "Accept-Encoding": "gzip, deflate, br",
+            },
+        )
 
     @abstractmethod
     async def scrape(self) -> list[dict[str, Any]]:
@@ -75,25 +187,208 @@ class BaseScraper(ABC):
         Returns response text on success, else None.
         """
         normalized_url = self.normalize_url(url)
+        if self.cache_ttl > 0:
+            cached = self._HTML_CACHE.get(normalized_url)
+            if cached is not None:
+                return cached[1]
+
+        stored = None
+        if self.DISK_CACHE_DIR and self.cache_ttl > 0:
+            # File reads and JSON decoding of up to MAX_HTML_BYTES stay off the event loop.
+            stored = await asyncio.to_thread(self._read_disk_cache, normalized_url)
+        if stored is not None:
+            remaining = stored["stored_at"] + stored["ttl"] - time.time()
+            if remaining > 0:
+                if len(stored["text"]) <= self._HTML_CACHE.maxsize:
+                    self._HTML_CACHE[normalized_url] = (remaining, stored["text"])
+                return stored["text"]
+
         if not await self.is_allowed_by_robots(normalized_url):
             logger.info("Blocked by robots.txt: %s", normalized_url)
             return None
 
-        await self._apply_rate_limit(normalized_url)
+        return await self._fetch_with_retry(normalized_url, stale=stored)
+
+    async def _fetch_with_retry(
+        self, url: str, *, max_retries: int | None = None, stale: dict[str, Any] | None = None
+    ) -> str | None:
+        """
+        Download url, retrying transient failures. Each attempt takes its own
+        rate-limit token, so retries never outrun the per-domain budget.
+        """
+        retries = self.MAX_RETRIES if max_retries is None else max_retries
+        for attempt in range(retries + 1):
+            await self._apply_rate_limit(url)
+            try:
+                return await self._download(url, stale)
+            except httpx.HTTPError as exc:
+                status_code = None
+                if isinstance(exc, httpx.HTTPStatusError):
+                    status_code = exc.response.status_code
+                retryable = (
+                    isinstance(exc, httpx.TransportError)
+                    or status_code in (408, 429)
+                    or (status_code is not None and status_code >= 500)
+                )
+                if not retryable or attempt >= retries:
+                    if status_code is not None and status_code < 500:
+                        logger.info("Fetch skipped for %s: %s", url, exc)
+                    else:
+                        logger.warning("Failed to fetch %s: %s", url, exc)
+                    return None
+
+                delay = self._retry_delay(attempt, exc)
+                logger.info("Retrying %s in %.1fs after: %s", url, delay, exc)
+                await asyncio.sleep(delay)
+        return None
+
+    def _retry_delay(self, attempt: int, exc: httpx.HTTPError) -> float:
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+            retry_after = exc.response.headers.get("retry-after", "").strip()
+            if retry_after.isdigit():
+                return min(float(retry_after), self.MAX_RETRY_AFTER_SECONDS)
+        return (2**attempt) * self.RETRY_BACKOFF_SECONDS + random.random() * 0.25
+
+    async def _download(self, url: str, stale: dict[str, Any] | None = None) -> str | None:
+        headers: dict[str, str] = {}
+        if stale is not None:
+            if stale.get("etag"):
+                headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                headers["If-Modified-Since"] = stale["last_modified"]
+
+        async with self._client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and stale is not None:
+                # 304 may omit the validators; keep the stored ones in that case.
+                await self._cache_html(
+                    url,
+                    stale["text"],
+                    response.headers.get("cache-control", ""),
+                    etag=response.headers.get("etag", stale.get("etag", "")),
+                    last_modified=response.headers.get("last-modified", stale.get("last_modified", "")),
+                )
+                return stale["text"]
 
-        try:
-            response = await self._client.get(normalized_url)
             response.raise_for_status()
-            return response.text
-        except httpx.HTTPError as exc:
-            status_code = None
-            if isinstance(exc, httpx.HTTPStatusError):
-                status_code = exc.response.status_code
-            if status_code is not None and status_code < 500:
-                logger.info("Fetch skipped for %s: %s", normalized_url, exc)
-            else:
-                logger.warning("Failed to fetch %s: %s", normalized_url, exc)
+
+            declared = response.headers.get("content-length", "")
+            if declared.isdigit() and int(declared) > self.MAX_HTML_BYTES:
+                logger.info("Skipping %s: Content-Length %s exceeds limit", url, declared)
+                return None
+
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > self.MAX_HTML_BYTES:
+                    logger.info("Skipping %s: body exceeds %s bytes", url, self.MAX_HTML_BYTES)
+                    return None
+
+            text = self._decode_body(body, response.charset_encoding)
+            await self._cache_html(
+                url,
+                text,
+                response.headers.get("cache-control", ""),
+                etag=response.headers.get("etag", ""),
+                last_modified=response.headers.get("last-modified", ""),
+            )
+            return text
+
+    @staticmethod
+    def _decode_body(body: bytes | bytearray, charset: str | None) -> str:
+        """
+        Decode with the Content-Type charset, else UTF-8; no content sniffing.
+        An unknown charset label falls back to UTF-8, as httpx does.
+        """
+        try:
+            return body.decode(charset or "utf-8", errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
+    async def _cache_html(
+        self, url: str, text: str, cache_control: str, etag: str = "", last_modified: str = ""
+    ) -> None:
+        """
+        Store a fetched body for cache_ttl seconds, or less if the response's
+        Cache-Control max-age is shorter. no-store responses are not cached.
+        """
+        ttl = self.cache_ttl
+        if ttl <= 0 or "no-store" in cache_control.lower():
+            return
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            ttl = min(ttl, float(match.group(1)))
+        if ttl > 0 and len(text) <= self._HTML_CACHE.maxsize:
+            self._HTML_CACHE[url] = (ttl, text)
+
+        # The disk copy outlives its TTL on purpose: once stale, its validators still
+        # let the next run revalidate instead of downloading the page again.
+        if self.DISK_CACHE_DIR and (ttl > 0 or etag or last_modified):
+            await asyncio.to_thread(
+                self._write_disk_cache,
+                url,
+                {
+                    "url": url,
+                    "stored_at": time.time(),
+                    "ttl": ttl,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "text": text,
+                },
+            )
+
+    def _disk_cache_path(self, url: str) -> Path:
+        return Path(self.DISK_CACHE_DIR) / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _read_disk_cache(self, url: str) -> dict[str, Any] | None:
+        # Runs in a worker thread.
+        try:
+            entry = orjson.loads(self._disk_cache_path(url).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as exc:
+            logger.info("Ignoring unreadable cache entry for %s: %s", url, exc)
             return None
+        # sha1 collisions are not a real concern, but a mismatched entry is never served.
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        # Older schemas or hand edits must not reach fetch(); validators go into request headers.
+        if not (
+            isinstance(entry.get("stored_at"), (int, float))
+            and isinstance(entry.get("ttl"), (int, float))
+            and isinstance(entry.get("text"), str)
+            and isinstance(entry.get("etag", ""), str)
+            and isinstance(entry.get("last_modified", ""), str)
+        ):
+            logger.info("Ignoring unreadable cache entry for %s: unexpected fields", url)
+            return None
+        return entry
+
+    def _write_disk_cache(self, url: str, entry: dict[str, Any]) -> None:
+        # Runs in a worker thread.
+        path = self._disk_cache_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a half-written file; the
+            # temp name is per thread since writes for one URL can run side by side.
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.info("Could not write cache entry for %s: %s", url, exc)
+
+    async def fetch_many(self, urls: list[str], max_concurrency: int = 8) -> list[str | None]:
+        """
+        Fetch several URLs concurrently, at most max_concurrency in flight.
+        Per-domain rate limiting still applies inside fetch().
+        Results are returned in the same order as urls.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch(url: str) -> str | None:
+            async with semaphore:
+                return await self.fetch(url)
+
+        return await asyncio.gather(*(_fetch(url) for url in urls))
 
     async def is_allowed_by_robots(self, url: str) -> bool:
         """
@@ -103,56 +398,102 @@ class BaseScraper(ABC):
         parsed = urlparse(url)
         domain = parsed.netloc
 
-        parser = self._robots_cache.get(domain)
+        parser = self._cached_robots(domain)
         if parser is None:
-            robots_url = f"{parsed.scheme}://{domain}/robots.txt"
-            parser = RobotFileParser()
-            parser.set_url(robots_url)
+            # One robots.txt request per domain, however many fetches are waiting on it.
+            async with self._robots_locks.setdefault(domain, asyncio.Lock()):
+                parser = self._cached_robots(domain)
+                if parser is None:
+                    parser = await self._load_robots(f"{parsed.scheme}://{domain}/robots.txt")
+                    self._robots_cache[domain] = (parser, time.monotonic())
 
-            try:
-                resp = await self._client.get(robots_url)
+        return parser.can_fetch(self.user_agent, url)
+
+    def _cached_robots(self, domain: str) -> RobotFileParser | None:
+        cached = self._robots_cache.get(domain)
+        if cached is not None and time.monotonic() - cached[1] <= self.ROBOTS_TTL_SECONDS:
+            return cached[0]
+        return None
+
+    async def _load_robots(self, robots_url: str) -> RobotFileParser:
+        parser = RobotFileParser()
+        parser.set_url(robots_url)
+
+        try:
+            async with self._client.stream("GET", robots_url) as resp:
                 if resp.status_code >= 400:
                     logger.info("No robots.txt available at %s (status %s)", robots_url, resp.status_code)
-                    self._robots_cache[domain] = parser
-                    return True
+                    # A never-parsed RobotFileParser denies everything; make the fallback explicit.
+                    parser.allow_all = True
+                    return parser
 
-                parser.parse(resp.text.splitlines())
-                self._robots_cache[domain] = parser
-            except httpx.HTTPError:
-                logger.info("Could not read robots.txt at %s; allowing fetch", robots_url)
-                self._robots_cache[domain] = parser
-                return True
+                lines: list[str] = []
+                size = 0
+                async for line in resp.aiter_lines():
+                    size += len(line) + 1
+                    if size > self.MAX_ROBOTS_BYTES:
+                        logger.info(
+                            "robots.txt at %s exceeds %s bytes; ignoring the rest",
+                            robots_url,
+                            self.MAX_ROBOTS_BYTES,
+                        )
+                        break
+                    lines.append(line)
 
-        return parser.can_fetch(self.user_agent, url)
+            parser.parse(lines)
+        except httpx.HTTPError:
+            logger.info("Could not read robots.txt at %s; allowing fetch", robots_url)
+            parser.allow_all = True
+        return parser
 
     async def _apply_rate_limit(self, url: str) -> None:
         """
-        Enforces a minimum delay between requests to the same domain.
+        Per-domain token bucket: refills at one token per rate_limit_seconds,
+        holds up to rate_limit_burst tokens, and each request takes one.
         """
+        if self.rate_limit_seconds <= 0:
+            return
+
         domain = urlparse(url).netloc
         lock = self._domain_locks.setdefault(domain, asyncio.Lock())
+        rate = 1 / self.rate_limit_seconds
+        capacity = float(self.rate_limit_burst)
 
         async with lock:
             now = time.monotonic()
-            last = self._last_request_ts.get(domain, 0.0)
-            elapsed = now - last
-
-            if elapsed < self.rate_limit_seconds:
-                await asyncio.sleep(self.rate_limit_seconds - elapsed)
+            tokens, last_refill = self._buckets.get(domain, (capacity, now))
+            tokens = min(capacity, tokens + (now - last_refill) * rate)
 
-            self._last_request_ts[domain] = time.monotonic()
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / rate)
+                self._buckets[domain] = (0.0, time.monotonic())
+            else:
+                self._buckets[domain] = (tokens - 1, now)
 
     @staticmethod
     def normalize_url(url: str) -> str:
         """
         Normalize URL by removing fragments and trimming trailing slash.
         """
-        parsed = urlparse(url.strip())
-        cleaned = parsed._replace(fragment="")
-        normalized = urlunparse(cleaned)
-        if normalized.endswith("/"):
-            normalized = normalized[:-1]
-        return normalized
+        return _normalize_url(url)
+
+    @staticmethod
+    def _dedupe(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Drop repeat records by (name, website), case-insensitively, keeping the first.
+        """
+        unique: dict[tuple[str, str], dict[str, Any]] = {}
+        for item in items:
+            key = (item.get("name", "").lower().strip(), item.get("website", "").lower().strip())
+            unique.setdefault(key, item)
+        return list(unique.values())
+
+    @staticmethod
+    def _element_text(element: etree._Element) -> str:
+        """
+        Text of an lxml element, same result as BeautifulSoup's get_text(" ", strip=True).
+        """
+        return " ".join(part for part in (text.strip() for text in _TEXT_XPATH(element)) if part)
 
     @staticmethod
     def to_absolute_url(base_url: str, maybe_relative_url: str) -> str:
@@ -164,15 +505,18 @@ class BaseScraper(ABC):
         website: str,
         career_page_url: str,
         country_of_origin: str,
+        source_url: str = "",
     ) -> dict[str, str]:
         """
         Standard company schema used across all scrapers.
         Includes source tracking required by your project.
+        Country and source repeat across thousands of records, so they are interned.
         """
         return {
             "name": name.strip(),
             "website": self.normalize_url(website),
             "career_page_url": self.normalize_url(career_page_url),
-            "country_of_origin": country_of_origin.strip(),
+            "country_of_origin": sys.intern(country_of_origin.strip()),
             "source": self.source_name,
+            "source_url": source_url,
         }
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import orjson
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from .base_scraper import BaseScraper
@@ -12,6 +14,11 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Selectors are compiled once instead of being re-parsed on every select() call.
+_SEL_ANCHORS = sv.compile("a[href]")
+_SEL_H1 = sv.compile("h1")
+_SEL_JSON_LD = sv.compile("script[type='application/ld+json']")
+
 
 class ClutchScraper(BaseScraper):
     SOURCE_NAME = "clutch"
@@ -30,21 +37,25 @@ class ClutchScraper(BaseScraper):
         results: list[dict[str, Any]] = []
         seen_profiles: set[str] = set()
 
-        for list_url in self.list_urls:
-            html = await self.fetch(list_url)
+        list_pages = await self.fetch_many(list(self.list_urls))
+        for list_url, html in zip(self.list_urls, list_pages):
             if not html:
                 continue
             if self._is_challenge_page(html):
                 logger.warning("Clutch is blocking scraping on %s", list_url)
                 continue
 
-            profile_urls = self._extract_profile_urls(html, list_url)
-            for profile_url in profile_urls:
+            profile_urls: list[str] = []
+            for profile_url in self._extract_profile_urls(html, list_url):
                 if profile_url in seen_profiles:
                     continue
                 seen_profiles.add(profile_url)
+                profile_urls.append(profile_url)
+                if len(seen_profiles) >= self.MAX_PROFILES:
+                    break
 
-                profile_html = await self.fetch(profile_url)
+            profile_pages = await self.fetch_many(profile_urls)
+            for profile_url, profile_html in zip(profile_urls, profile_pages):
                 if not profile_html or self._is_challenge_page(profile_html):
                     continue
 
@@ -52,52 +63,35 @@ class ClutchScraper(BaseScraper):
                 if company:
                     results.append(company)
 
-                if len(seen_profiles) >= self.MAX_PROFILES:
-                    break
-
         return self._dedupe(results)
 
     def _extract_profile_urls(self, html: str, base_url: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        found: list[str] = []
-        seen: set[str] = set()
+        soup = BeautifulSoup(html, "lxml")
+        # Insertion-ordered dict doubles as the seen-set and the result list.
+        found: dict[str, None] = {}
 
         for obj in self._extract_json_ld_objects(soup):
-            if isinstance(obj, dict):
-                url = (obj.get("url") or "").strip()
+            items = obj if isinstance(obj, list) else [obj]
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                url = (item.get("url") or "").strip()
                 if self._is_profile_url(url):
-                    normalized = self.normalize_url(url)
-                    if normalized not in seen:
-                        seen.add(normalized)
-                        found.append(normalized)
-            if isinstance(obj, list):
-                for item in obj:
-                    if not isinstance(item, dict):
-                        continue
-                    url = (item.get("url") or "").strip()
-                    if self._is_profile_url(url):
-                        normalized = self.normalize_url(url)
-                        if normalized not in seen:
-                            seen.add(normalized)
-                            found.append(normalized)
-
-        for link in soup.select("a[href]"):
+                    found[self.normalize_url(url)] = None
+
+        for link in _SEL_ANCHORS.select(soup):
             href = (link.get("href") or "").strip()
             absolute = self.normalize_url(urljoin(base_url, href))
-            if not self._is_profile_url(absolute):
-                continue
-            if absolute in seen:
-                continue
-            seen.add(absolute)
-            found.append(absolute)
+            if self._is_profile_url(absolute):
+                found[absolute] = None
 
-        return found
+        return list(found)
 
     def _parse_profile(self, html: str, profile_url: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         name = ""
-        h1 = soup.select_one("h1")
+        h1 = _SEL_H1.select_one(soup)
         if h1:
             name = h1.get_text(" ", strip=True)
 
@@ -107,17 +101,16 @@ class ClutchScraper(BaseScraper):
         if not name or not website:
             return None
 
-        return {
-            "name": name,
-            "website": website,
-            "career_page_url": "",
-            "country_of_origin": country or "Unknown",
-            "source": self.source_name,
-            "source_url": profile_url,
-        }
+        return self.build_company_record(
+            name=name,
+            website=website,
+            career_page_url="",
+            country_of_origin=country or "Unknown",
+            source_url=profile_url,
+        )
 
     def _extract_company_website(self, soup: BeautifulSoup) -> str:
-        for link in soup.select("a[href]"):
+        for link in _SEL_ANCHORS.select(soup):
             href = (link.get("href") or "").strip()
             if not href.startswith("http"):
                 continue
@@ -136,7 +129,7 @@ class ClutchScraper(BaseScraper):
             if any(token in attrs for token in ("visit website", "website", "client site")):
                 return self.normalize_url(href)
 
-        for link in soup.select("a[href]"):
+        for link in _SEL_ANCHORS.select(soup):
             href = (link.get("href") or "").strip()
             if not href.startswith("http"):
                 continue
@@ -173,13 +166,14 @@ class ClutchScraper(BaseScraper):
     @staticmethod
     def _extract_json_ld_objects(soup: BeautifulSoup) -> list[Any]:
         objects: list[Any] = []
-        for script in soup.select("script[type='application/ld+json']"):
+        for script in _SEL_JSON_LD.select(soup):
             raw = script.string or script.get_text(strip=True)
             if not raw:
                 continue
             try:
-                objects.append(json.loads(raw))
-            except Exception:
+                # str() unwraps bs4's NavigableString, which orjson does not accept.
+                objects.append(orjson.loads(str(raw)))
+            except orjson.JSONDecodeError:
                 continue
         return objects
 
@@ -189,6 +183,7 @@ class ClutchScraper(BaseScraper):
         return "just a moment" in lowered and "cf-challenge" in lowered
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_profile_url(url: str) -> bool:
         if not url:
             return False
@@ -199,15 +194,3 @@ class ClutchScraper(BaseScraper):
         if not path:
             return False
         return "/profile/" in f"/{path}/" or path.endswith("-company")
-
-    @staticmethod
-    def _dedupe(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-        seen: set[tuple[str, str]] = set()
-        for item in items:
-            key = (item.get("name", "").lower().strip(), item.get("website", "").lower().strip())
-            if key in seen:
-                continue
-            seen.add(key)
-            results.append(item)
-        return results
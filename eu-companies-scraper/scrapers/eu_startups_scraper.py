@@ -5,13 +5,45 @@ import re
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from .base_scraper import BaseScraper
 
 
 logger = logging.getLogger(__name__)
 
+# Directory and category pages are only mined for links; skip building the rest.
+_LINK_STRAINER = SoupStrainer("a")
+# At parse time bs4 matches class against the raw attribute string, so match the token.
+_LISTING_TITLE_STRAINER = SoupStrainer(class_=re.compile(r"(?:^|\s)listing-title(?:\s|$)"))
+
+# First URL-looking token in a listing's website field; upper-case schemes still match.
+_URL_RE = re.compile(r"https?://\S+|www\.\S+", re.IGNORECASE)
+_URL_TRAILING_PUNCTUATION = ".,;)"
+
+# Selectors are compiled once instead of being re-parsed on every select() call.
+_SEL_CATEGORY_LINKS = sv.compile("a[href*='/directory/wpbdp_category/']")
+_SEL_LISTING_LINKS = sv.compile(".listing-title a[href*='/directory/']")
+
+# Listing fields in priority order: the ".value" form wins over ".wpbdp-field-value"
+# when both exist, and the first match in document order wins within each form.
+_LISTING_FIELD_SELECTORS = {
+    "name": ("h1",),
+    "website": (".wpbdp-field-website .value", ".wpbdp-field-website .wpbdp-field-value"),
+    "country": (".wpbdp-field-category .value", ".wpbdp-field-category .wpbdp-field-value"),
+    "business_name": (
+        ".wpbdp-field-business_name .value",
+        ".wpbdp-field-business_name .wpbdp-field-value",
+    ),
+}
+# One walk collects every candidate; the per-selector matchers only run on those few tags.
+_SEL_LISTING_FIELDS = sv.compile(", ".join(sel for sels in _LISTING_FIELD_SELECTORS.values() for sel in sels))
+_LISTING_FIELD_MATCHERS = tuple(
+    (field, rank, sv.compile(selector))
+    for field, selectors in _LISTING_FIELD_SELECTORS.items()
+    for rank, selector in enumerate(selectors)
+)
 
 class EUStartupsScraper(BaseScraper):
     SOURCE_NAME = "eu_startups"
@@ -34,8 +66,8 @@ class EUStartupsScraper(BaseScraper):
         listing_urls: list[str] = []
         seen_listing_urls: set[str] = set()
 
-        for category_url in category_urls[: self.MAX_CATEGORY_PAGES]:
-            category_html = await self.fetch(category_url)
+        category_pages = await self.fetch_many(category_urls[: self.MAX_CATEGORY_PAGES])
+        for category_html in category_pages:
             if not category_html:
                 continue
 
@@ -51,8 +83,8 @@ class EUStartupsScraper(BaseScraper):
                 break
 
         results: list[dict[str, Any]] = []
-        for listing_url in listing_urls:
-            listing_html = await self.fetch(listing_url)
+        listing_pages = await self.fetch_many(listing_urls)
+        for listing_url, listing_html in zip(listing_urls, listing_pages):
             if not listing_html:
                 continue
 
@@ -63,27 +95,22 @@ class EUStartupsScraper(BaseScraper):
         return self._dedupe(results)
 
     def _extract_category_urls(self, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        urls: list[str] = []
-        seen: set[str] = set()
+        soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
+        urls: dict[str, None] = {}
 
-        for link in soup.select("a[href*='/directory/wpbdp_category/']"):
+        for link in _SEL_CATEGORY_LINKS.select(soup):
             href = (link.get("href") or "").strip()
             if not href:
                 continue
             absolute = self.normalize_url(urljoin(self.DIRECTORY_URL, href))
-            if absolute in seen:
-                continue
-            seen.add(absolute)
-            urls.append(absolute)
-        return urls
+            urls[absolute] = None
+        return list(urls)
 
     def _extract_listing_urls(self, html: str) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        urls: list[str] = []
-        seen: set[str] = set()
+        soup = BeautifulSoup(html, "lxml", parse_only=_LISTING_TITLE_STRAINER)
+        urls: dict[str, None] = {}
 
-        for link in soup.select(".listing-title a[href*='/directory/']"):
+        for link in _SEL_LISTING_LINKS.select(soup):
             href = (link.get("href") or "").strip()
             if not href:
                 continue
@@ -92,21 +119,19 @@ class EUStartupsScraper(BaseScraper):
                 continue
             if "wpbdp_view=" in absolute:
                 continue
-            if absolute in seen:
-                continue
-            seen.add(absolute)
-            urls.append(absolute)
-        return urls
+            urls[absolute] = None
+        return list(urls)
 
     def _parse_listing_page(self, html: str, source_url: str) -> dict[str, Any] | None:
-        soup = BeautifulSoup(html, "html.parser")
-        name_tag = soup.select_one("h1")
+        soup = BeautifulSoup(html, "lxml")
+        fields = self._select_fields(soup)
+        name_tag = fields.get("name")
         if not name_tag:
             return None
 
         name = name_tag.get_text(" ", strip=True)
         if self._looks_like_url(name):
-            fallback_name = self._extract_business_name(soup)
+            fallback_name = self._field_text(fields.get("business_name"))
             if fallback_name:
                 name = fallback_name
         if not name:
@@ -114,36 +139,32 @@ class EUStartupsScraper(BaseScraper):
         if self._looks_like_url(name):
             return None
 
-        website = self._extract_website(soup)
+        website = self._extract_website(fields.get("website"))
         if not website:
             return None
 
-        country = self._extract_country(soup) or "Unknown"
+        country = self._field_text(fields.get("country")) or "Unknown"
 
-        return {
-            "name": name,
-            "website": website,
-            "career_page_url": "",
-            "country_of_origin": country,
-            "source": self.source_name,
-            "source_url": source_url,
-        }
+        return self.build_company_record(
+            name=name,
+            website=website,
+            career_page_url="",
+            country_of_origin=country,
+            source_url=source_url,
+        )
 
-    def _extract_website(self, soup: BeautifulSoup) -> str:
-        website_field = soup.select_one(".wpbdp-field-website .value")
-        if not website_field:
-            website_field = soup.select_one(".wpbdp-field-website .wpbdp-field-value")
+    def _extract_website(self, website_field: Tag | None) -> str:
         if not website_field:
             return ""
 
         raw_text = website_field.get_text(" ", strip=True)
         if not raw_text:
             return ""
-        match = re.search(r"(https?://[^\s]+|www\.[^\s]+)", raw_text, flags=re.IGNORECASE)
+        match = _URL_RE.search(raw_text)
         if not match:
             return ""
 
-        value = match.group(1).strip().rstrip(".,;)")
+        value = match.group().rstrip(_URL_TRAILING_PUNCTUATION)
         if not value.startswith(("http://", "https://")):
             value = "https://" + value
 
@@ -155,35 +176,25 @@ class EUStartupsScraper(BaseScraper):
         canonical = f"{parsed.scheme or 'https'}://{parsed.netloc}"
         return self.normalize_url(canonical)
 
-    def _extract_country(self, soup: BeautifulSoup) -> str:
-        country_field = soup.select_one(".wpbdp-field-category .value")
-        if not country_field:
-            country_field = soup.select_one(".wpbdp-field-category .wpbdp-field-value")
-        if not country_field:
-            return ""
-        return country_field.get_text(" ", strip=True)
+    @staticmethod
+    def _select_fields(soup: BeautifulSoup) -> dict[str, Tag]:
+        best: dict[str, tuple[int, Tag]] = {}
+        for tag in _SEL_LISTING_FIELDS.select(soup):
+            for field, rank, matcher in _LISTING_FIELD_MATCHERS:
+                current = best.get(field)
+                if current is not None and current[0] <= rank:
+                    continue
+                if matcher.match(tag):
+                    best[field] = (rank, tag)
+        return {field: tag for field, (_rank, tag) in best.items()}
 
-    def _extract_business_name(self, soup: BeautifulSoup) -> str:
-        business_field = soup.select_one(".wpbdp-field-business_name .value")
-        if not business_field:
-            business_field = soup.select_one(".wpbdp-field-business_name .wpbdp-field-value")
-        if not business_field:
+    @staticmethod
+    def _field_text(field: Tag | None) -> str:
+        if not field:
             return ""
-        return business_field.get_text(" ", strip=True)
+        return field.get_text(" ", strip=True)
 
     @staticmethod
     def _looks_like_url(value: str) -> bool:
         lowered = value.lower().strip()
         return lowered.startswith(("http://", "https://", "www."))
-
-    @staticmethod
-    def _dedupe(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-        seen: set[tuple[str, str]] = set()
-        for item in items:
-            key = (item.get("name", "").lower().strip(), item.get("website", "").lower().strip())
-            if key in seen:
-                continue
-            seen.add(key)
-            results.append(item)
-        return results
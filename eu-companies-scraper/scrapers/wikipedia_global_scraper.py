@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from .wikipedia_scraper import WikipediaScraper
@@ -65,6 +66,16 @@ class WikipediaGlobalScraper(WikipediaScraper):
         "vatican city",
     }
 
+    # Single-word names are matched by hashing the space-separated tokens; only the few
+    # multi-word names need a scan. Both keep the old rule that a name is delimited by a
+    # space or the string edge, like " country " in " text ".
+    _EUROPE_SINGLE_WORD = frozenset(country for country in EUROPE_COUNTRIES if " " not in country)
+    _EUROPE_MULTI_WORD_RE = re.compile(
+        r"(?<![^ ])(?:"
+        + "|".join(re.escape(country) for country in sorted(EUROPE_COUNTRIES - _EUROPE_SINGLE_WORD, key=len, reverse=True))
+        + r")(?![^ ])"
+    )
+
     async def scrape(self) -> list[dict[str, Any]]:
         records = await super().scrape()
         filtered: list[dict[str, Any]] = []
@@ -77,9 +88,6 @@ class WikipediaGlobalScraper(WikipediaScraper):
     def _is_europe_country_text(self, text: str) -> bool:
         if not text:
             return False
-        normalized = " " + text + " "
-        for country in self.EUROPE_COUNTRIES:
-            token = " " + country + " "
-            if token in normalized:
-                return True
-        return False
+        if not self._EUROPE_SINGLE_WORD.isdisjoint(text.split(" ")):
+            return True
+        return self._EUROPE_MULTI_WORD_RE.search(text) is not None
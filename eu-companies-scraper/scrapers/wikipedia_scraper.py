@@ -1,17 +1,118 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
-from urllib.parse import quote, urlparse
+from urllib.parse import quote, urlparse, urlsplit
 
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, DomainState
 
 
 logger = logging.getLogger(__name__)
 
+_BRACKET_RE = re.compile(r"\[[^\]]+\]")
+_WS_RE = re.compile(r"\s+")
+
+# List pages are streamed with iterparse and read with compiled XPath. Attribute and text
+# results are plain str (smart_strings=False) so cached values never pin a parsed page.
+_WIKITABLES_XPATH = etree.XPath(
+    "descendant-or-self::table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]"
+)
+_ROWS_XPATH = etree.XPath(".//tr")
+_HEADER_CELLS_XPATH = etree.XPath(".//th")
+_CELLS_XPATH = etree.XPath(".//*[self::th or self::td]")
+_LINK_HREFS_XPATH = etree.XPath(".//a/@href", smart_strings=False)
+# Company pages: links in the cells of infobox rows whose first header mentions "website"
+# (any case), in document order; the official-website/homepage sidebar links are the fallback.
+_INFOBOX_WEBSITE_HREFS_XPATH = etree.XPath(
+    "descendant-or-self::table[contains(concat(' ', normalize-space(@class), ' '), ' infobox ')]"
+    "//tr[(.//th)[1]//text()[not(parent::script or parent::style)]"
+    "[contains(translate(., 'WEBSITE', 'website'), 'website')]]"
+    "//td//a/@href",
+    smart_strings=False,
+)
+_SIDEBAR_WEBSITE_IDS = frozenset(("t-officialwebsite", "t-homepage"))
+
+
+@lru_cache(maxsize=4096)
+def _is_external(href: str) -> bool:
+    """
+    True for http(s) links whose host is not Wikipedia. Only the host is checked,
+    so an external URL that merely mentions wikipedia.org in its path still counts.
+    """
+    try:
+        parsed = urlsplit(href)
+        host = parsed.hostname or ""
+    except ValueError:
+        return False
+    if parsed.scheme not in ("http", "https") or not host:
+        return False
+    return host != "wikipedia.org" and not host.endswith(".wikipedia.org")
+
+
+def _first_external_url(hrefs: list[str]) -> str:
+    for href in hrefs:
+        href = href.strip()
+        if _is_external(href):
+            return BaseScraper.normalize_url(href)
+    return ""
+
+
+def _extract_official_website(html: str) -> str:
+    """
+    Official website of a company article, or "".
+    """
+    # One streaming pass over tables and list items. The infobox sits near the top of
+    # the article, so a hit there stops parsing before the rest of the page is read;
+    # the first sidebar link seen is kept in case no infobox has one.
+    fallback = ""
+    source = io.BytesIO(html.encode("utf-8"))
+    try:
+        for _event, element in etree.iterparse(
+            source, events=("end",), tag=("table", "li"), html=True, encoding="utf-8"
+        ):
+            if element.tag == "li":
+                if (
+                    not fallback
+                    and element.get("id") in _SIDEBAR_WEBSITE_IDS
+                    and not any(li.get("id") in _SIDEBAR_WEBSITE_IDS for li in element.iterancestors("li"))
+                ):
+                    fallback = _first_external_url(_LINK_HREFS_XPATH(element))
+                continue
+
+            # Nested tables are read with their outermost table, keeping document order.
+            if next(element.iterancestors("table"), None) is not None:
+                continue
+            website = _first_external_url(_INFOBOX_WEBSITE_HREFS_XPATH(element))
+            if website:
+                return website
+            element.clear()
+    except etree.LxmlError:
+        # Empty or unreadable page; keep whatever the part already read produced.
+        return fallback
+    return fallback
+
+
+@dataclass(slots=True)
+class _CompanyRow:
+    """
+    One list-table row while it is backfilled and deduplicated. Only rows that
+    survive become schema dicts, built by build_company_record.
+    """
+
+    name: str
+    website: str
+    country_of_origin: str
+    company_wiki_url: str
+
 
 class WikipediaScraper(BaseScraper):
     """
@@ -23,10 +124,41 @@ class WikipediaScraper(BaseScraper):
 
     WIKIPEDIA_LIST_URL = "https://en.wikipedia.org/wiki/List_of_largest_companies_in_Europe_by_revenue"
     SOURCE_NAME = "wikipedia"
-
-    def __init__(self, list_url: str | None = None) -> None:
-        super().__init__(source_name=self.SOURCE_NAME, rate_limit_seconds=0.35)
-        self.list_url = list_url or self.WIKIPEDIA_LIST_URL
+    # Header substrings that identify each column role; the first matching header wins.
+    _NAME_TOKENS = ("company", "name", "corporation")
+    _WEBSITE_TOKENS = ("website", "web", "url")
+    _COUNTRY_TOKENS = ("country", "headquarters", "hq", "location")
+    # One alternation per role, wrapped in a lookahead so every position is tried and a
+    # header such as "Company website" still reports both roles.
+    _HEADER_ROLE_RE = re.compile(
+        "(?=%s)"
+        % "|".join(
+            f"(?P<{role}>{'|'.join(map(re.escape, tokens))})"
+            for role, tokens in (
+                ("name", _NAME_TOKENS),
+                ("website", _WEBSITE_TOKENS),
+                ("country", _COUNTRY_TOKENS),
+            )
+        )
+    )
+
+    # Company pages needed to backfill missing websites; the per-domain rate limit still applies.
+    COMPANY_PAGE_CONCURRENCY = 16
+
+    def __init__(
+        self,
+        list_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        domain_state: DomainState | None = None,
+    ) -> None:
+        super().__init__(
+            source_name=self.SOURCE_NAME,
+            rate_limit_seconds=0.35,
+            client=client,
+            domain_state=domain_state,
+        )
+        # Stored on every row of the list page; keep one shared string.
+        self.list_url = sys.intern(list_url or self.WIKIPEDIA_LIST_URL)
 
     async def scrape(self) -> list[dict[str, Any]]:
         """
@@ -39,183 +171,172 @@ class WikipediaScraper(BaseScraper):
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
-        companies = self._extract_companies_from_tables(soup)
-        companies = await self._fill_missing_websites_from_company_pages(companies)
+        try:
+            rows = self._extract_companies_from_tables(html)
+        except etree.LxmlError:
+            return []
+        rows = await self._fill_missing_websites_from_company_pages(rows)
 
         deduped: list[dict[str, Any]] = []
         seen_websites: set[str] = set()
         seen_names: set[str] = set()
 
-        for company in companies:
-            website = company["website"]
-            name_key = self._normalize_text_key(company["name"])
-
-            if website and website in seen_websites:
-                continue
-            if name_key in seen_names:
+        normalize_key = self._normalize_text_key
+        for row in rows:
+            website = row.website
+            name_key = normalize_key(row.name)
+            if name_key in seen_names or (website and website in seen_websites):
                 continue
 
+            seen_names.add(name_key)
             if website:
                 seen_websites.add(website)
-            seen_names.add(name_key)
-            deduped.append(company)
+            deduped.append(
+                self.build_company_record(
+                    name=row.name,
+                    website=website,
+                    career_page_url="",
+                    country_of_origin=row.country_of_origin,
+                    source_url=self.list_url,
+                )
+            )
 
         return deduped
 
-    async def _fill_missing_websites_from_company_pages(
-        self, companies: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        for company in companies:
-            if company.get("website"):
-                continue
+    async def _fill_missing_websites_from_company_pages(self, rows: list[_CompanyRow]) -> list[_CompanyRow]:
+        targets = [row for row in rows if row.company_wiki_url and not row.website]
+        if not targets:
+            return rows
 
-            company_wiki_url = company.get("company_wiki_url", "")
-            if not company_wiki_url:
-                continue
+        semaphore = asyncio.Semaphore(self.COMPANY_PAGE_CONCURRENCY)
 
-            html = await self.fetch(company_wiki_url)
+        # Each page is parsed as soon as it arrives, in the gaps between the rate-limited
+        # downloads of the others. The scan stops at the infobox, so it stays short.
+        async def _backfill(row: _CompanyRow) -> None:
+            async with semaphore:
+                html = await self.fetch(row.company_wiki_url)
             if not html:
+                return
+            website = _extract_official_website(html)
+            if website:
+                row.website = website
+
+        await asyncio.gather(*(_backfill(row) for row in targets))
+        return rows
+
+    def _extract_companies_from_tables(self, html: str) -> list[_CompanyRow]:
+        """
+        Wikipedia list pages are usually table-driven. We parse each wikitable and
+        locate likely columns for company name, website, and country.
+        """
+        results: list[_CompanyRow] = []
+        # Tables are handled as soon as they close; what has been read is freed, so the
+        # navboxes, references and prose around them never pile up into a full tree.
+        source = io.BytesIO(html.encode("utf-8"))
+        for _event, table in etree.iterparse(source, events=("end",), tag="table", html=True, encoding="utf-8"):
+            # A nested table is read with its outermost table, keeping document order.
+            if next(table.iterancestors("table"), None) is not None:
                 continue
 
-            website = self._extract_official_website_from_company_page(html)
-            if website:
-                company["website"] = website
+            for wikitable in _WIKITABLES_XPATH(table):
+                results.extend(self._extract_companies_from_table(wikitable))
 
-        for company in companies:
-            company.pop("company_wiki_url", None)
-        return companies
+            table.clear()
+            while table.getprevious() is not None:
+                del table.getparent()[0]
 
-    def _extract_official_website_from_company_page(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
+        return results
 
-        for row in soup.select("table.infobox tr"):
-            header = row.select_one("th")
-            if not header:
-                continue
-            header_text = header.get_text(" ", strip=True).lower()
-            if "website" not in header_text:
-                continue
+    def _extract_companies_from_table(self, table: etree._Element) -> list[_CompanyRow]:
+        rows = _ROWS_XPATH(table)
+        if not rows:
+            return []
 
-            links = row.select("td a[href]")
-            for link in links:
-                href = (link.get("href") or "").strip()
-                if href.startswith("http") and "wikipedia.org" not in href:
-                    return self.normalize_url(href)
+        headers = [self._clean_cell_text(self._element_text(th)) for th in _HEADER_CELLS_XPATH(rows[0])]
+        if not headers:
+            return []
 
-        external_section = soup.select("li#t-officialwebsite a[href], li#t-homepage a[href]")
-        for link in external_section:
-            href = (link.get("href") or "").strip()
-            if href.startswith("http") and "wikipedia.org" not in href:
-                return self.normalize_url(href)
-        return ""
+        name_idx, website_idx, country_idx = self._find_header_indices(headers)
 
-    def _extract_companies_from_tables(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
-        """
-        Wikipedia list pages are usually table-driven. We parse each wikitable and
-        locate likely columns for company name, website, and country.
-        """
-        results: list[dict[str, Any]] = []
-        tables = soup.select("table.wikitable")
+        if name_idx is None:
+            return []
 
-        for table in tables:
-            header_row = table.select_one("tr")
-            if not header_row:
+        results: list[_CompanyRow] = []
+        for row in rows[1:]:
+            cells = _CELLS_XPATH(row)
+            # Rows too short to reach the name column (spanning notes, footers) cannot
+            # yield a record. Shorter website/country columns are fine: rowspans do that.
+            if len(cells) <= name_idx:
                 continue
-
-            headers = [self._clean_cell_text(th.get_text(" ", strip=True)) for th in header_row.select("th")]
-            if not headers:
+            # Skip non-data rows that only contain headers.
+            if all(cell.tag == "th" for cell in cells):
                 continue
 
-            name_idx = self._find_header_index(headers, ["company", "name", "corporation"])
-            website_idx = self._find_header_index(headers, ["website", "web", "url"])
-            country_idx = self._find_header_index(headers, ["country", "headquarters", "hq", "location"])
-
-            if name_idx is None:
+            name = self._read_text_cell(cells, name_idx)
+            if not name:
                 continue
 
-            rows = table.select("tr")
-            for row in rows[1:]:
-                cells = row.find_all(["th", "td"])
-                if not cells:
-                    continue
-                # Skip non-data rows that only contain headers.
-                if all(cell.name == "th" for cell in cells):
-                    continue
-
-                name = self._read_text_cell(cells, name_idx)
-                if not name:
-                    continue
-
-                company_wiki_url = self._extract_company_wiki_url(cells, name_idx)
-                website = self._extract_website(cells, website_idx)
-                country = self._read_text_cell(cells, country_idx) if country_idx is not None else ""
-                country = country or "Unknown"
-
-                results.append(
-                    {
-                        "name": name,
-                        "website": website,
-                        "career_page_url": "",
-                        "country_of_origin": country,
-                        "source": self.source_name,
-                        "source_url": self.list_url,
-                        "company_wiki_url": company_wiki_url,
-                    }
-                )
+            company_wiki_url = self._extract_company_wiki_url(cells, name_idx)
+            website = self._extract_website(cells, website_idx)
+            country = self._read_text_cell(cells, country_idx) if country_idx is not None else ""
+            country = country or "Unknown"
+
+            results.append(_CompanyRow(name, website, country, company_wiki_url))
 
         return results
 
     def _extract_website(self, cells: list[Any], idx: int | None) -> str:
         if idx is not None and idx < len(cells):
-            links = cells[idx].select("a[href]")
-            for link in links:
-                href = (link.get("href") or "").strip()
+            for href in _LINK_HREFS_XPATH(cells[idx]):
+                href = href.strip()
                 if href.startswith("http"):
                     return self.normalize_url(href)
 
         for cell in cells:
-            links = cell.select("a[href]")
-            for link in links:
-                href = (link.get("href") or "").strip()
-                if href.startswith("http") and "wikipedia.org" not in href:
+            for href in _LINK_HREFS_XPATH(cell):
+                href = href.strip()
+                if _is_external(href):
                     return self.normalize_url(href)
         return ""
 
     def _extract_company_wiki_url(self, cells: list[Any], idx: int | None) -> str:
         if idx is None or idx >= len(cells):
             return ""
-        for link in cells[idx].select("a[href]"):
-            href = (link.get("href") or "").strip()
+        for href in _LINK_HREFS_XPATH(cells[idx]):
+            href = href.strip()
             if href.startswith("/wiki/") and ":" not in href:
                 return self.to_absolute_url("https://en.wikipedia.org", href)
             if href.startswith("https://en.wikipedia.org/wiki/") and ":" not in href:
                 return self.normalize_url(href)
         return ""
 
-    @staticmethod
-    def _find_header_index(headers: list[str], candidates: list[str]) -> int | None:
-        lowered = [h.lower() for h in headers]
-        for i, header in enumerate(lowered):
-            if any(token in header for token in candidates):
-                return i
-        return None
+    @classmethod
+    def _find_header_indices(cls, headers: list[str]) -> tuple[int | None, int | None, int | None]:
+        """
+        Resolve the (name, website, country) column indices in one pass over the headers.
+        """
+        roles: dict[str, int] = {}
+        for i, header in enumerate(headers):
+            for match in cls._HEADER_ROLE_RE.finditer(header.lower()):
+                roles.setdefault(match.lastgroup, i)
+        return roles.get("name"), roles.get("website"), roles.get("country")
 
     @staticmethod
     def _read_text_cell(cells: list[Any], idx: int | None) -> str:
         if idx is None or idx >= len(cells):
             return ""
-        return WikipediaScraper._clean_cell_text(cells[idx].get_text(" ", strip=True))
+        return WikipediaScraper._clean_cell_text(WikipediaScraper._element_text(cells[idx]))
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _clean_cell_text(text: str) -> str:
-        text = re.sub(r"\[[^\]]+\]", "", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        # Header labels and country names repeat across rows and tables.
+        return _WS_RE.sub(" ", _BRACKET_RE.sub("", text)).strip()
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _normalize_text_key(text: str) -> str:
-        return re.sub(r"\s+", " ", text.lower()).strip()
+        return _WS_RE.sub(" ", text.lower()).strip()
 
     @staticmethod
     def wikipedia_page_url(title: str) -> str: